@@ -0,0 +1,246 @@
+"""
+Bulk encryption and decryption of directory trees.
+
+Walks a source directory, encrypts or decrypts every file across a process pool
+(largest files first) and writes the results to the same relative paths under an
+output directory. The status and timing of every file are recorded in a JSON
+manifest, so an interrupted run resumes where it stopped and files that have not
+changed since they were processed (same size and modification time) are skipped.
+"""
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from encryption import encrypt, decrypt
+from finishing_touches import save_to_file, load_from_file, is_valid_keyword
+
+
+MANIFEST_NAME = ".bulk_manifest.json"
+
+# PBKDF2 iterations for the keyword check stored in the manifest
+KEYWORD_HASH_ITERATIONS = 200000
+
+
+def collect_files(source_dir, exclude_dir=None):
+    """
+    List the files of a directory tree with their size and modification time.
+
+    Args:
+        source_dir (str): The directory to walk
+        exclude_dir (str, optional): A directory inside the tree to leave out (e.g. the output directory)
+
+    Returns:
+        dict: A mapping of paths relative to source_dir to (size, mtime) pairs
+    """
+    files = {}
+    excluded = os.path.abspath(exclude_dir) if exclude_dir else None
+    for directory, subdirectories, filenames in os.walk(source_dir):
+        subdirectories[:] = [name for name in subdirectories
+                             if os.path.abspath(os.path.join(directory, name)) != excluded]
+        for filename in filenames:
+            if filename == MANIFEST_NAME:
+                continue
+            path = os.path.join(directory, filename)
+            stat = os.stat(path)
+            files[os.path.relpath(path, source_dir)] = (stat.st_size, stat.st_mtime)
+    return files
+
+
+def keyword_digest(keyword, salt, iterations=KEYWORD_HASH_ITERATIONS):
+    """
+    Hash a keyword so a manifest can tell keywords apart without storing them.
+
+    The manifest sits next to the ciphertexts, so a salted, slow hash is used to
+    keep dictionary keywords from being recovered from it offline.
+
+    Args:
+        keyword (str): The keyword for columnar transposition
+        salt (bytes): A random salt stored in the manifest
+        iterations (int): The number of PBKDF2 iterations
+
+    Returns:
+        str: The hex PBKDF2-HMAC-SHA256 digest of the keyword
+    """
+    return hashlib.pbkdf2_hmac("sha256", keyword.encode("utf-8"), salt, iterations).hex()
+
+
+def load_manifest(filename, mode, keyword):
+    """
+    Load a job manifest, starting a new one if it is missing or was made for another mode or keyword.
+
+    Args:
+        filename (str): The manifest filename
+        mode (str): "encrypt" or "decrypt"
+        keyword (str): The keyword for columnar transposition
+
+    Returns:
+        dict: The manifest
+    """
+    if os.path.exists(filename):
+        try:
+            with open(filename, 'r') as file:
+                manifest = json.load(file)
+            check = manifest.get("keyword_check")
+            if manifest.get("mode") == mode and check:
+                digest = keyword_digest(keyword, bytes.fromhex(check["salt"]), check["iterations"])
+                if hmac.compare_digest(digest, check["digest"]):
+                    return manifest
+        except Exception as e:
+            print(f"Error loading manifest: {e}")
+
+    salt = os.urandom(16)
+    keyword_check = {
+        "salt": salt.hex(),
+        "iterations": KEYWORD_HASH_ITERATIONS,
+        "digest": keyword_digest(keyword, salt),
+    }
+    return {"mode": mode, "keyword_check": keyword_check, "files": {}}
+
+
+def save_manifest(manifest, filename):
+    """
+    Save a job manifest, replacing the previous one atomically.
+
+    Args:
+        manifest (dict): The manifest
+        filename (str): The manifest filename
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    temporary = filename + ".tmp"
+    try:
+        with open(temporary, 'w') as file:
+            json.dump(manifest, file, indent=2, sort_keys=True)
+        os.replace(temporary, filename)
+        return True
+    except Exception as e:
+        print(f"Error saving manifest: {e}")
+        return False
+
+
+def process_file(mode, source_path, output_path, keyword):
+    """
+    Encrypt or decrypt a single file.
+
+    Args:
+        mode (str): "encrypt" or "decrypt"
+        source_path (str): The file to read
+        output_path (str): The file to write the result to
+        keyword (str): The keyword for columnar transposition
+
+    Returns:
+        tuple: (status, elapsed, error) where status is "done" or "failed"
+    """
+    start = time.perf_counter()
+    try:
+        content = load_from_file(source_path)
+        if content is None:
+            raise ValueError("Failed to load the file.")
+
+        if mode == "encrypt":
+            # One process per file already; the shared puzzle bank is not safe to write concurrently
+            result, _ = encrypt(content, keyword, bank_file=None, workers=1)
+        else:
+            result = decrypt(content, keyword)
+
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if not save_to_file(result, output_path):
+            raise ValueError("Failed to save the file.")
+    except Exception as e:
+        return "failed", time.perf_counter() - start, str(e)
+
+    return "done", time.perf_counter() - start, None
+
+
+def process_tree(mode, source_dir, output_dir, keyword, workers=None, manifest_file=None):
+    """
+    Encrypt or decrypt every file of a directory tree.
+
+    Args:
+        mode (str): "encrypt" or "decrypt"
+        source_dir (str): The directory to read files from
+        output_dir (str): The directory to write results to
+        keyword (str): The keyword for columnar transposition
+        workers (int, optional): The number of worker processes, os.cpu_count() if None
+        manifest_file (str, optional): The manifest filename, MANIFEST_NAME in output_dir if None
+
+    Returns:
+        dict: The number of files processed, skipped and failed
+    """
+    if mode not in ("encrypt", "decrypt"):
+        raise ValueError(f"Unknown mode: {mode}")
+    if not is_valid_keyword(keyword):
+        raise ValueError("Invalid keyword.")
+
+    os.makedirs(output_dir, exist_ok=True)
+    if manifest_file is None:
+        manifest_file = os.path.join(output_dir, MANIFEST_NAME)
+    manifest = load_manifest(manifest_file, mode, keyword)
+    entries = manifest["files"]
+
+    # Skip files already processed that have not changed since and whose output is still there
+    pending = []
+    skipped = 0
+    for path, (size, mtime) in collect_files(source_dir, output_dir).items():
+        entry = entries.get(path)
+        if (entry and entry["status"] == "done" and entry["size"] == size and entry["mtime"] == mtime
+                and os.path.exists(os.path.join(output_dir, path))):
+            skipped += 1
+            continue
+        entries[path] = {"status": "pending", "size": size, "mtime": mtime, "elapsed": None, "error": None}
+        pending.append(path)
+    save_manifest(manifest, manifest_file)
+
+    # Schedule the largest files first so a long file does not start last
+    pending.sort(key=lambda path: entries[path]["size"], reverse=True)
+
+    processed = 0
+    failed = 0
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(process_file, mode, os.path.join(source_dir, path),
+                                os.path.join(output_dir, path), keyword): path
+                for path in pending
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                status, elapsed, error = future.result()
+                entries[path].update(status=status, elapsed=elapsed, error=error)
+                if status == "done":
+                    processed += 1
+                else:
+                    failed += 1
+                # Record every completion so an interrupted run can resume
+                save_manifest(manifest, manifest_file)
+
+    return {"processed": processed, "skipped": skipped, "failed": failed}
+
+
+def main():
+    """
+    Run bulk encryption or decryption from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Encrypt or decrypt every file of a directory tree.")
+    parser.add_argument("mode", choices=["encrypt", "decrypt"])
+    parser.add_argument("source_dir")
+    parser.add_argument("output_dir")
+    parser.add_argument("keyword")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--manifest", default=None)
+    args = parser.parse_args()
+
+    summary = process_tree(args.mode, args.source_dir, args.output_dir, args.keyword,
+                           args.workers, args.manifest)
+    print(f"Processed: {summary['processed']}, skipped: {summary['skipped']}, failed: {summary['failed']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,52 +3,92 @@ Cryptarithmetic puzzle generation and solving.
 """
 import random
 import re
+from functools import lru_cache
+from itertools import permutations
 
 
-def generate_simple_puzzle(letters):
+def generate_simple_puzzle(letters, num_addends=2):
     """
-    Generate a simple cryptarithmetic puzzle (WORD1 + WORD2 = WORD3) using the given letters.
+    Generate a simple cryptarithmetic puzzle (WORD1 + ... + WORDN = RESULT) using the given letters.
     
     Args:
         letters (str): The letters to use in the puzzle
+        num_addends (int): The number of words added together
         
     Returns:
         str: A cryptarithmetic puzzle string
     """
-    # Ensure we have enough letters
-    if len(set(letters)) < 6:
+    # analyze_feasibility rejects puzzles with fewer than three words, so one addend would never pass
+    if not 2 <= num_addends <= 8:
+        raise ValueError("A puzzle needs between 2 and 8 addends.")
+    
+    # Ensure we have enough letters: one distinct first letter per word plus some others
+    min_letters = max(6, num_addends + 3)
+    if len(set(letters)) < min_letters:
         # Add some random letters if needed
         additional_letters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
         for char in additional_letters:
             if char not in letters:
                 letters += char
-                if len(set(letters)) >= 6:
+                if len(set(letters)) >= min_letters:
                     break
     
     # Ensure we're working with unique letters
     unique_letters = list(set(letters.upper()))
     random.shuffle(unique_letters)
     
-    # Create three words of different lengths for the puzzle
-    word1_len = random.randint(2, 4)
-    word2_len = random.randint(2, 4)
-    word3_len = random.randint(max(word1_len, word2_len), word1_len + word2_len)
+    # Create the addends, and a result no longer than the top carry allows
+    addend_lengths = [random.randint(2, 4) for _ in range(num_addends)]
+    longest = max(addend_lengths)
+    max_carry = max_top_carry(num_addends)
+    max_extra = len(str(max_carry)) if max_carry else 0
+    result_length = random.randint(longest, longest + max_extra)
     
     # Ensure first letters are not zero
-    first_letters = unique_letters[:3]
-    remaining_letters = unique_letters[3:min(10, len(unique_letters))]
+    first_letters = unique_letters[:num_addends + 1]
+    remaining_letters = unique_letters[num_addends + 1:min(10, len(unique_letters))]
     
     # Create the words
-    word1 = first_letters[0] + ''.join(random.choices(remaining_letters, k=word1_len-1))
-    word2 = first_letters[1] + ''.join(random.choices(remaining_letters, k=word2_len-1))
-    word3 = first_letters[2] + ''.join(random.choices(remaining_letters, k=word3_len-1))
+    words = []
+    for first_letter, length in zip(first_letters, addend_lengths + [result_length]):
+        words.append(first_letter + ''.join(random.choices(remaining_letters, k=length-1)))
     
     # Create the puzzle string
-    puzzle = f"{word1} + {word2} = {word3}"
+    puzzle = format_puzzle(words)
     
     return puzzle
 
 
+def format_puzzle(words):
+    """
+    Build a puzzle string from its words.
+    
+    Args:
+        words (list): The words in the puzzle, the last one being the result
+        
+    Returns:
+        str: The puzzle string (e.g., "SEND + MORE = MONEY")
+    """
+    return " + ".join(words[:-1]) + " = " + words[-1]
+
+
+# Separates the puzzles of a message encrypted with more than one puzzle
+PUZZLE_SEPARATOR = "; "
+
+
+def split_puzzles(encrypted):
+    """
+    Split an encrypted message into its puzzles.
+    
+    Args:
+        encrypted (str): The encrypted message
+        
+    Returns:
+        list: The puzzle strings
+    """
+    return [puzzle.strip() for puzzle in encrypted.split(PUZZLE_SEPARATOR.strip()) if puzzle.strip()]
+
+
 def parse_puzzle(puzzle_string):
     """
     Parse a cryptarithmetic puzzle string into its components.
@@ -98,17 +138,230 @@ def evaluate_puzzle(puzzle, assignment):
             number = number * 10 + assignment[letter]
         numbers.append(number)
     
-    # Check if the equation is satisfied (assuming WORD1 + WORD2 = WORD3)
-    return numbers[0] + numbers[1] == numbers[2]
+    # Check if the equation is satisfied (the addends sum to the last word)
+    return sum(numbers[:-1]) == numbers[-1]
+
+
+def letter_coefficients(words):
+    """
+    Compute the coefficient of each letter in the puzzle's linear equation.
+    
+    The puzzle WORD1 + ... + WORDN = RESULT holds exactly when the sum of
+    coefficient * digit over all letters is zero: each occurrence of a letter in
+    an addend adds its place value, and each occurrence in the result subtracts it.
+    
+    Args:
+        words (list): The words in the puzzle, the last one being the result
+        
+    Returns:
+        dict: A dictionary mapping letters to their coefficients
+    """
+    coefficients = {}
+    for index, word in enumerate(words):
+        sign = -1 if index == len(words) - 1 else 1
+        place_value = 1
+        for letter in reversed(word):
+            coefficients[letter] = coefficients.get(letter, 0) + sign * place_value
+            place_value *= 10
+    return coefficients
+
+
+def evaluate_coefficients(coefficients, assignment):
+    """
+    Evaluate a puzzle in coefficient form with a complete digit assignment.
+    
+    Args:
+        coefficients (dict): The letter coefficients (see letter_coefficients)
+        assignment (dict): A dictionary mapping letters to digits
+        
+    Returns:
+        bool: True if the assignment satisfies the puzzle, False otherwise
+    """
+    return sum(coefficient * assignment[letter] for letter, coefficient in coefficients.items()) == 0
+
+
+def puzzle_pattern(words):
+    """
+    Compute the letter pattern of a puzzle, independent of the actual letters.
+    
+    Letters are renamed in order of first appearance, so "SEND + MORE = MONEY"
+    and "TAXI + BUSY = BULKS" share the pattern "ABCD+EFGB=EFCBH".
+    
+    Args:
+        words (list): The words in the puzzle, the last one being the result
+        
+    Returns:
+        tuple: (pattern, letters) where letters lists the puzzle's letters in order of first appearance
+    """
+    letters = []
+    names = {}
+    for letter in ''.join(words):
+        if letter not in names:
+            names[letter] = chr(ord('A') + len(letters))
+            letters.append(letter)
+    
+    renamed = [''.join(names[letter] for letter in word) for word in words]
+    pattern = "+".join(renamed[:-1]) + "=" + renamed[-1]
+    
+    return pattern, letters
+
+
+def compile_puzzle_checker(words):
+    """
+    Compile a puzzle into a specialized function that checks a complete assignment.
+    
+    The generated function takes one digit per letter (in the order returned by
+    puzzle_pattern), checks the leading letters of multi-letter words for zero one
+    by one and tests the sum as a single expression with the letter coefficients
+    folded in as constants. It is equivalent to evaluate_puzzle and is cached per
+    puzzle pattern.
+    
+    Args:
+        words (list): The words in the puzzle, the last one being the result
+        
+    Returns:
+        tuple: (checker, letters) where checker(*digits) returns True if the digits
+            satisfy the puzzle and letters gives the order of its arguments
+    """
+    pattern, letters = puzzle_pattern(words)
+    return _compile_pattern_checker(pattern), letters
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern_checker(pattern):
+    # The pattern's letters are A, B, C, ... in argument order, so argument i is named d<i>
+    words = re.findall(r'[A-Z]+', pattern)
+    letters = sorted(set(''.join(words)))
+    names = {letter: f"d{ord(letter) - ord('A')}" for letter in letters}
+    coefficients = letter_coefficients(words)
+    
+    # Leading zeros are only a problem for words with more than one letter
+    leading = []
+    for word in words:
+        name = names[word[0]]
+        if len(word) > 1 and name not in leading:
+            leading.append(name)
+    
+    terms = [f"{coefficients[letter]} * {names[letter]}" for letter in letters if coefficients[letter] != 0]
+    conditions = [f"{name} != 0" for name in leading]
+    conditions.append(f"{' + '.join(terms) or '0'} == 0")
+    
+    source = (f"def check({', '.join(names[letter] for letter in letters)}):\n"
+              f"    return {' and '.join(conditions)}\n")
+    namespace = {}
+    exec(source, namespace)
+    return namespace["check"]
+
+
+def max_top_carry(num_addends):
+    """
+    Compute the largest carry a sum of the given number of addends can produce.
+    
+    Args:
+        num_addends (int): The number of addends
+        
+    Returns:
+        int: The largest carry out of any column
+    """
+    carry = 0
+    while True:
+        next_carry = (9 * num_addends + carry) // 10
+        if next_carry == carry:
+            return carry
+        carry = next_carry
+
+
+def analyze_feasibility(words):
+    """
+    Statically check whether a parsed puzzle can have a solution, without searching.
+    
+    Rejects puzzles with more than 10 distinct letters, a result whose length
+    cannot match the sum of the addends, or a top column that no digits and carry
+    can satisfy. Also reports digits that are forced, such as the extra leading
+    letter of the result, which must be 1 for a sum of two addends.
+    
+    Args:
+        words (list): The words in the puzzle, the last one being the result
+        
+    Returns:
+        tuple: (feasible, reason, forced_digits) where reason explains a rejection
+            (None if feasible) and forced_digits maps letters to their only possible digit
+    """
+    if len(words) < 3:
+        return False, "fewer than three words", {}
+    
+    if len(set(''.join(words))) > 10:
+        return False, "more than 10 distinct letters", {}
+    
+    addends, result = words[:-1], words[-1]
+    longest = max(len(word) for word in addends)
+    max_carry = max_top_carry(len(addends))
+    max_extra = len(str(max_carry)) if max_carry else 0
+    
+    if len(result) < longest:
+        return False, "result shorter than the longest addend", {}
+    if len(result) > longest + max_extra:
+        return False, "result longer than the addends can produce", {}
+    
+    # A single extra leading digit of the result is the top carry
+    forced = {}
+    if len(result) == longest + 1 and max_carry == 1:
+        forced[result[0]] = 1
+    
+    if len(result) <= longest + 1 and not _top_column_consistent(words, longest, max_carry, forced):
+        return False, "carry contradiction in the top column", forced
+    
+    return True, None, forced
+
+
+def _top_column_consistent(words, longest, max_carry, forced, max_free_letters=4):
+    # Try every digit assignment for the letters of the top addend column
+    addends, result = words[:-1], words[-1]
+    top_letters = [word[0] for word in addends if len(word) == longest]
+    column_letter = result[len(result) - longest]
+    carry_letter = result[0] if len(result) > longest else None
+    
+    involved = set(top_letters) | {column_letter}
+    if carry_letter is not None:
+        involved.add(carry_letter)
+    free_letters = [letter for letter in involved if letter not in forced]
+    
+    # Keep the check cheap; the solver will deal with columns too wide to enumerate
+    if len(free_letters) > max_free_letters:
+        return True
+    
+    first_letters = {word[0] for word in words}
+    max_carry_in = max_carry if longest > 1 else 0
+    free_digits = [digit for digit in range(10) if digit not in forced.values()]
+    
+    for digits in permutations(free_digits, len(free_letters)):
+        value = dict(forced)
+        value.update(zip(free_letters, digits))
+        
+        if any(value[letter] == 0 for letter in involved if letter in first_letters):
+            continue
+        
+        carry_out = value[carry_letter] if carry_letter is not None else 0
+        if carry_out > max_carry:
+            continue
+        
+        total = sum(value[letter] for letter in top_letters)
+        for carry_in in range(max_carry_in + 1):
+            if total + carry_in == value[column_letter] + 10 * carry_out:
+                return True
+    
+    return False
 
 
-def solve_cryptarithmetic(puzzle_string, use_heuristic=False):
+def solve_cryptarithmetic(puzzle_string, use_heuristic=False, forced_digits=None, compiled=False):
     """
     Solve a cryptarithmetic puzzle using backtracking search.
     
     Args:
         puzzle_string (str): The puzzle string (e.g., "SEND + MORE = MONEY")
         use_heuristic (bool): Whether to use a heuristic for variable ordering
+        forced_digits (dict, optional): Letters whose digit is already known (see analyze_feasibility)
+        compiled (bool): Whether to check leaves with a compiled checker (see compile_puzzle_checker)
         
     Returns:
         dict: A dictionary mapping letters to digits, or None if no solution exists
@@ -127,15 +380,36 @@ def solve_cryptarithmetic(puzzle_string, use_heuristic=False):
     # Get the first letters of each word (can't be assigned 0)
     first_letters = {word[0] for word in words}
     
+    # Reduce the puzzle to one coefficient per letter so checking a leaf costs the
+    # same however many addends there are
+    if compiled:
+        checker, checker_letters = compile_puzzle_checker(words)
+        
+        def is_solution(assignment):
+            return checker(*map(assignment.__getitem__, checker_letters))
+    else:
+        coefficients = letter_coefficients(words)
+        
+        def is_solution(assignment):
+            return evaluate_coefficients(coefficients, assignment)
+    
+    if forced_digits is None:
+        forced_digits = {}
+    
     def backtrack(index, assignment, used_digits):
         # Base case: all letters assigned
         if index == len(letters):
-            return assignment if evaluate_puzzle(words, assignment) else None
+            return assignment if is_solution(assignment) else None
         
         current_letter = letters[index]
         
-        # Try each possible digit
-        for digit in range(10):
+        # Try each possible digit (only one if the letter's digit is forced)
+        if current_letter in forced_digits:
+            candidate_digits = (forced_digits[current_letter],)
+        else:
+            candidate_digits = range(10)
+        
+        for digit in candidate_digits:
             # Skip if digit already used
             if digit in used_digits:
                 continue
@@ -162,6 +436,20 @@ def solve_cryptarithmetic(puzzle_string, use_heuristic=False):
     return backtrack(0, {}, set())
 
 
+def solve_puzzles(puzzle_strings, use_heuristic=False):
+    """
+    Solve several cryptarithmetic puzzles with compiled checkers.
+    
+    Args:
+        puzzle_strings (list): The puzzle strings
+        use_heuristic (bool): Whether to use a heuristic for variable ordering
+        
+    Returns:
+        list: The solution of each puzzle (None where no solution exists)
+    """
+    return [solve_cryptarithmetic(puzzle, use_heuristic, compiled=True) for puzzle in puzzle_strings]
+
+
 def is_puzzle_solvable(puzzle_string):
     """
     Check if a cryptarithmetic puzzle has a unique solution.
@@ -2,11 +2,11 @@
 Hybrid encryption and decryption functions.
 """
 from transposition_cipher import encrypt_transposition, decrypt_transposition
-from cryptarithmetic import solve_cryptarithmetic, create_substitution_key
-from genetic_algorithm import generate_puzzle_ga
+from cryptarithmetic import solve_cryptarithmetic, create_substitution_key, split_puzzles, PUZZLE_SEPARATOR
+from puzzle_planner import generate_planned_puzzles
 
 
-def encrypt(plaintext, keyword):
+def encrypt(plaintext, keyword, profile=None, bank_file=None, workers=None, stats=None):
     """
     Encrypt plaintext using the hybrid approach: columnar transposition followed
     by cryptarithmetic-based substitution with genetic algorithm puzzle generation.
@@ -14,21 +14,30 @@ def encrypt(plaintext, keyword):
     Args:
         plaintext (str): The plaintext to encrypt
         keyword (str): The keyword for columnar transposition
+        profile (dict, optional): A tuned GA profile. The saved profile is used if None.
+        bank_file (str, optional): A puzzle bank file to reuse and store puzzles in (e.g.
+            puzzle_planner.DEFAULT_BANK_PATH); no bank is used if None
+        workers (int, optional): The number of processes generating puzzles, os.cpu_count() if None
+        stats (dict, optional): If given, filled with the "checked" and "rejected" counts
+            of the feasibility pre-filter during puzzle generation
         
     Returns:
         tuple: A tuple containing (cryptarithmetic_puzzle, transposition_key)
-            where cryptarithmetic_puzzle is the encrypted message and
-            transposition_key is the keyword used for transposition
+            where cryptarithmetic_puzzle is the encrypted message (one or more
+            puzzles joined by PUZZLE_SEPARATOR) and transposition_key is the
+            keyword used for transposition
     """
     # Step 1: Perform columnar transposition
     transposed_text = encrypt_transposition(plaintext, keyword)
     
-    # Step 2: Use genetic algorithm to generate a cryptarithmetic puzzle
-    # that uses the letters in the transposed text
-    puzzle_individual = generate_puzzle_ga(transposed_text)
+    # Step 2: Split the letters of the transposed text into groups of at most 10
+    # and use the genetic algorithm to generate a cryptarithmetic puzzle per group
+    puzzles, feasibility = generate_planned_puzzles(transposed_text, profile, bank_file, workers)
+    if stats is not None:
+        stats.update(feasibility)
     
-    # Step 3: Return the puzzle as the encrypted message
-    return (puzzle_individual.puzzle_string, keyword)
+    # Step 3: Return the puzzles as the encrypted message
+    return (PUZZLE_SEPARATOR.join(puzzles), keyword)
 
 
 def decrypt(encrypted_puzzle, keyword, use_heuristic=False):
@@ -36,35 +45,37 @@ def decrypt(encrypted_puzzle, keyword, use_heuristic=False):
     Decrypt an encrypted message using the hybrid approach.
     
     Args:
-        encrypted_puzzle (str): The cryptarithmetic puzzle
+        encrypted_puzzle (str): The cryptarithmetic puzzle(s)
         keyword (str): The keyword for columnar transposition
         use_heuristic (bool): Whether to use a heuristic for cryptarithmetic solving
         
     Returns:
         str: The decrypted plaintext
     """
-    # Step 1: Solve the cryptarithmetic puzzle
-    solution = solve_cryptarithmetic(encrypted_puzzle, use_heuristic)
-    
-    if solution is None:
-        raise ValueError("Failed to solve the cryptarithmetic puzzle.")
-    
-    # Step 2: Create a substitution key from the solution
-    substitution_key = create_substitution_key(encrypted_puzzle, solution)
-    
-    # Step 3: Extract the letters from the puzzle
-    # We'll use the puzzle format directly as our ciphertext
-    ciphertext = encrypted_puzzle
-    
-    # Step 4: Perform reverse substitution to get the transposed text
     transposed_text = ""
-    for char in ciphertext:
-        if char.isalpha():
-            # Use the substitution key to map back to digits
-            transposed_text += str(substitution_key.get(char, char))
-        else:
-            # Keep non-alphabetic characters as is
-            transposed_text += char
+    # Each puzzle has its own solution, so substitute one puzzle at a time
+    for puzzle in split_puzzles(encrypted_puzzle):
+        # Step 1: Solve the cryptarithmetic puzzle
+        solution = solve_cryptarithmetic(puzzle, use_heuristic, compiled=True)
+        
+        if solution is None:
+            raise ValueError("Failed to solve the cryptarithmetic puzzle.")
+        
+        # Step 2: Create a substitution key from the solution
+        substitution_key = create_substitution_key(puzzle, solution)
+        
+        # Step 3: Extract the letters from the puzzle
+        # We'll use the puzzle format directly as our ciphertext
+        ciphertext = puzzle
+        
+        # Step 4: Perform reverse substitution to get the transposed text
+        for char in ciphertext:
+            if char.isalpha():
+                # Use the substitution key to map back to digits
+                transposed_text += str(substitution_key.get(char, char))
+            else:
+                # Keep non-alphabetic characters as is
+                transposed_text += char
     
     # Remove any non-alphanumeric characters (spaces, +, =, etc.)
     transposed_text = ''.join(char for char in transposed_text if char.isalnum())
@@ -3,6 +3,8 @@ Utility functions for the hybrid encryption application.
 """
 import os
 
+from cryptarithmetic import split_puzzles
+
 
 def save_to_file(content, filename):
     """
@@ -24,6 +26,27 @@ def save_to_file(content, filename):
         return False
 
 
+def save_chunks_to_file(chunks, filename):
+    """
+    Save content to a file one chunk at a time.
+    
+    Args:
+        chunks (iterable): An iterable of strings to write in order
+        filename (str): The filename to save to
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        with open(filename, 'w') as file:
+            for chunk in chunks:
+                file.write(chunk)
+        return True
+    except Exception as e:
+        print(f"Error saving to file: {e}")
+        return False
+
+
 def load_from_file(filename):
     """
     Load content from a file.
@@ -77,11 +100,16 @@ def format_puzzle_display(puzzle_string):
     Format a cryptarithmetic puzzle for display.
     
     Args:
-        puzzle_string (str): The puzzle string
+        puzzle_string (str): The puzzle string, possibly holding several puzzles
         
     Returns:
         str: The formatted puzzle string
     """
+    # Format each puzzle of a multi-puzzle message separately
+    puzzles = split_puzzles(puzzle_string)
+    if len(puzzles) > 1:
+        return "\n\n".join(format_puzzle_display(puzzle) for puzzle in puzzles)
+    
     # Split the puzzle into its components
     parts = puzzle_string.split("=")
     left_side = parts[0].strip()
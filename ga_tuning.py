@@ -0,0 +1,295 @@
+"""
+Auto-tuning of genetic algorithm parameters by letter-set size.
+
+Runs seeded trials of the genetic algorithm over a grid of parameters, records
+the time needed to reach a target fitness for each letter-set size and stores
+the best parameters in a profile that encryption can consult at runtime.
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import string
+import time
+
+from genetic_algorithm import generate_puzzle_ga, feasibility_rejection_rate
+
+
+# Parameters used when no profile is available (the previous hardcoded values)
+DEFAULT_GA_PARAMETERS = {
+    "population_size": 50,
+    "generations": 20,
+    "tournament_size": 3,
+    "mutation_rate": 0.2,
+}
+
+DEFAULT_PARAMETER_GRID = {
+    "population_size": [10, 25, 50],
+    "generations": [5, 10, 20],
+    "tournament_size": [2, 3],
+    "mutation_rate": [0.1, 0.2, 0.4],
+}
+
+DEFAULT_PROFILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ga_profile.json")
+
+# Loaded profiles, keyed by filename, as (modification time, profile) pairs
+_profile_cache = {}
+
+
+def letter_set_size(letters):
+    """
+    Count the distinct letters (A-Z, case-insensitive) in a text.
+
+    Args:
+        letters (str): The text
+
+    Returns:
+        int: The number of distinct letters
+    """
+    return len(set(letters.upper()) & set(string.ascii_uppercase))
+
+
+def addends_for_group(letters):
+    """
+    Choose how many addends a puzzle needs to have room for a group of letters.
+
+    Two addends of up to 4 letters leave room for about 6 distinct letters, so
+    larger groups get one more addend for every 3 letters.
+
+    Args:
+        letters (str): The letters of the group
+
+    Returns:
+        int: The number of addends (2 to 4)
+    """
+    return max(2, min(4, -(-len(set(letters)) // 3)))
+
+
+def parameter_combinations(grid):
+    """
+    Expand a parameter grid into individual parameter sets.
+
+    Args:
+        grid (dict): A mapping of parameter names to lists of candidate values
+
+    Returns:
+        list: A list of parameter dictionaries
+    """
+    names = sorted(grid)
+    combinations = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        parameters = dict(zip(names, values))
+        # Tournament selection samples without replacement from the population
+        if parameters["tournament_size"] <= parameters["population_size"]:
+            combinations.append(parameters)
+    return combinations
+
+
+def max_fitness(size):
+    """
+    Compute the best fitness a puzzle can reach for a letter set of the given size.
+
+    Fitness is 0.7 * completeness + 0.3 * complexity, and a puzzle holds at most
+    10 letters, so completeness cannot exceed 10 / size.
+
+    Args:
+        size (int): The number of distinct letters to cover
+
+    Returns:
+        float: The highest reachable fitness
+    """
+    return 0.7 * min(10, size) / size + 0.3 if size else 1.0
+
+
+def run_trial(letters, parameters, seed, target_fitness):
+    """
+    Run one seeded genetic algorithm trial with as many addends as the planner uses for the letters.
+
+    Args:
+        letters (str): The letters to include in the puzzle
+        parameters (dict): The genetic algorithm parameters
+        seed (int): The random seed for the trial
+        target_fitness (float): The fitness the trial should reach
+
+    Returns:
+        tuple: (elapsed, fitness, rejection_rate) where elapsed is the time in seconds to
+            reach the target fitness (None if it was not reached), fitness is the best
+            fitness found and rejection_rate is the feasibility pre-filter's rejection rate
+    """
+    random.seed(seed)
+    start = time.perf_counter()
+    best = generate_puzzle_ga(letters, target_fitness=target_fitness, num_addends=addends_for_group(letters),
+                              **parameters)
+    elapsed = time.perf_counter() - start
+
+    return (elapsed if best.fitness >= target_fitness else None), best.fitness, feasibility_rejection_rate(best)
+
+
+def tune_parameters(sizes, grid=None, seeds=(0, 1, 2), target_fitness=0.8):
+    """
+    Find the fastest parameters for each letter-set size.
+
+    Args:
+        sizes (iterable): The letter-set sizes to tune
+        grid (dict, optional): The parameter grid, DEFAULT_PARAMETER_GRID if None
+        seeds (iterable): The seeds to run for every parameter set
+        target_fitness (float): The fraction of the reachable fitness (see max_fitness) each trial should reach
+
+    Returns:
+        dict: The tuned profile
+    """
+    if grid is None:
+        grid = DEFAULT_PARAMETER_GRID
+    combinations = parameter_combinations(grid)
+    seeds = list(seeds)
+
+    profile = {"target_fitness": target_fitness, "sizes": {}}
+    for size in sizes:
+        # Use the same letters for every parameter set so the trials are comparable
+        letters = ''.join(random.Random(size).sample(string.ascii_uppercase, size))
+        size_target = target_fitness * max_fitness(size)
+
+        best_entry = None
+        for parameters in combinations:
+            times = []
+            fitnesses = []
+            rejection_rates = []
+            for seed in seeds:
+                elapsed, fitness, rejection_rate = run_trial(letters, parameters, seed, size_target)
+                times.append(elapsed)
+                fitnesses.append(fitness)
+                rejection_rates.append(rejection_rate)
+            reached = [t for t in times if t is not None]
+
+            entry = dict(parameters)
+            entry["target_fitness"] = size_target
+            entry["success_rate"] = len(reached) / len(seeds)
+            entry["mean_time"] = sum(reached) / len(reached) if reached else None
+            entry["mean_fitness"] = sum(fitnesses) / len(fitnesses)
+            entry["rejection_rate"] = sum(rejection_rates) / len(rejection_rates)
+
+            # Prefer parameters that reach the target most often, then the fastest ones,
+            # then (if none reach it) the ones getting closest
+            if best_entry is None or _is_better(entry, best_entry):
+                best_entry = entry
+
+        profile["sizes"][str(size)] = best_entry
+
+    return profile
+
+
+def _is_better(entry, other):
+    if entry["success_rate"] != other["success_rate"]:
+        return entry["success_rate"] > other["success_rate"]
+    if entry["mean_time"] is not None and other["mean_time"] is not None:
+        return entry["mean_time"] < other["mean_time"]
+    if entry["mean_time"] is None and other["mean_time"] is None:
+        return entry["mean_fitness"] > other["mean_fitness"]
+    return entry["mean_time"] is not None
+
+
+def save_profile(profile, filename=DEFAULT_PROFILE_PATH):
+    """
+    Save a tuned profile to a JSON file.
+
+    Args:
+        profile (dict): The tuned profile
+        filename (str): The filename to save to
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        with open(filename, 'w') as file:
+            json.dump(profile, file, indent=2)
+        # Reloaded on next use, with the new modification time
+        _profile_cache.pop(filename, None)
+        return True
+    except Exception as e:
+        print(f"Error saving profile: {e}")
+        return False
+
+
+def load_profile(filename=DEFAULT_PROFILE_PATH):
+    """
+    Load a tuned profile from a JSON file.
+
+    Args:
+        filename (str): The filename to load from
+
+    Returns:
+        dict: The tuned profile, or None if it does not exist or could not be read
+    """
+    # Nothing is cached for a missing file, so a profile saved later (e.g. by
+    # another process running the tuner) is picked up
+    if not os.path.exists(filename):
+        return None
+
+    mtime = os.path.getmtime(filename)
+    cached = _profile_cache.get(filename)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        with open(filename, 'r') as file:
+            profile = json.load(file)
+    except Exception as e:
+        print(f"Error loading profile: {e}")
+        return None
+
+    _profile_cache[filename] = (mtime, profile)
+    return profile
+
+
+def select_ga_parameters(letters, profile=None):
+    """
+    Choose genetic algorithm parameters for the given letters.
+
+    Args:
+        letters (str): The letters the puzzle should include
+        profile (dict, optional): A tuned profile. The default profile file is used if None.
+
+    Returns:
+        dict: Keyword arguments for generate_puzzle_ga, including the tuned
+            target_fitness so the run stops where the tuning trials stopped
+    """
+    if profile is None:
+        profile = load_profile()
+    if not profile or not profile.get("sizes"):
+        return dict(DEFAULT_GA_PARAMETERS)
+
+    # Use the tuned entry for the closest letter-set size
+    size = letter_set_size(letters)
+    closest = min(profile["sizes"], key=lambda key: (abs(int(key) - size), int(key)))
+    entry = profile["sizes"][closest]
+
+    parameters = {name: entry[name] for name in DEFAULT_GA_PARAMETERS}
+    if entry.get("target_fitness") is not None:
+        parameters["target_fitness"] = entry["target_fitness"]
+    return parameters
+
+
+def main():
+    """
+    Tune the genetic algorithm parameters from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Tune genetic algorithm parameters by letter-set size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 5, 7, 10],
+                        help="Letter-set sizes to tune (the planner never gives a puzzle more than 10 letters)")
+    parser.add_argument("--seeds", type=int, default=3, help="Number of seeded trials per parameter set")
+    parser.add_argument("--target-fitness", type=float, default=0.8,
+                        help="Fraction of the best fitness reachable for each size")
+    parser.add_argument("--output", default=DEFAULT_PROFILE_PATH)
+    args = parser.parse_args()
+
+    profile = tune_parameters(args.sizes, seeds=range(args.seeds), target_fitness=args.target_fitness)
+    for size, entry in profile["sizes"].items():
+        print(f"{size} letters: {entry}")
+
+    if save_profile(profile, args.output):
+        print(f"Profile saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
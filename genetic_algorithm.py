@@ -3,29 +3,37 @@ Genetic algorithm for cryptarithmetic puzzle generation.
 """
 import random
 import string
-from cryptarithmetic import generate_simple_puzzle, parse_puzzle, solve_cryptarithmetic, is_puzzle_solvable
+from cryptarithmetic import (generate_simple_puzzle, parse_puzzle, solve_cryptarithmetic, is_puzzle_solvable,
+                             analyze_feasibility, format_puzzle)
 
 
 class PuzzleIndividual:
     """
     Represents a single cryptarithmetic puzzle in the genetic algorithm population.
     """
-    def __init__(self, puzzle_string=None, letters=None):
+    def __init__(self, puzzle_string=None, letters=None, num_addends=2):
         """
         Initialize a puzzle individual, either with a provided puzzle or by generating a random one.
         
         Args:
             puzzle_string (str, optional): A puzzle string. If None, a random puzzle will be generated.
             letters (str, optional): Letters to use for puzzle generation. Required if puzzle_string is None.
+            num_addends (int): The number of addends of a generated puzzle
         """
         if puzzle_string:
             self.puzzle_string = puzzle_string
         else:
-            self.puzzle_string = generate_simple_puzzle(letters)
+            self.puzzle_string = generate_simple_puzzle(letters, num_addends)
         
         self.words, self.unique_letters = parse_puzzle(self.puzzle_string)
         self.fitness = 0
         self.solution = None
+        self.rejected = False
+        
+        # Set on the individual returned by generate_puzzle_ga: how many puzzles
+        # the run checked with the feasibility pre-filter and how many it rejected
+        self.feasibility_checked = 0
+        self.feasibility_rejected = 0
     
     def calculate_fitness(self, target_letters):
         """
@@ -37,8 +45,16 @@ class PuzzleIndividual:
         Returns:
             float: The fitness score (higher is better)
         """
+        # Reject provably unsolvable puzzles before running the solver
+        feasible, _, forced_digits = analyze_feasibility(self.words)
+        self.rejected = not feasible
+        if not feasible:
+            self.solution = None
+            self.fitness = 0
+            return self.fitness
+        
         # Try to solve the puzzle
-        self.solution = solve_cryptarithmetic(self.puzzle_string)
+        self.solution = solve_cryptarithmetic(self.puzzle_string, forced_digits=forced_digits, compiled=True)
         
         # If the puzzle is not solvable, it has minimum fitness
         if self.solution is None:
@@ -58,20 +74,36 @@ class PuzzleIndividual:
         return self.fitness
 
 
-def initial_population(size, letters):
+def feasibility_rejection_rate(individual):
+    """
+    Get the fraction of puzzles the feasibility pre-filter rejected during a GA run.
+    
+    Args:
+        individual (PuzzleIndividual): The individual returned by generate_puzzle_ga
+        
+    Returns:
+        float: The rejection rate (0 if nothing was checked)
+    """
+    if individual.feasibility_checked == 0:
+        return 0.0
+    return individual.feasibility_rejected / individual.feasibility_checked
+
+
+def initial_population(size, letters, num_addends=2):
     """
     Create an initial population of puzzle individuals.
     
     Args:
         size (int): The population size
         letters (str): The letters to use for puzzle generation
+        num_addends (int): The number of addends in each puzzle
         
     Returns:
         list: A list of PuzzleIndividual objects
     """
     population = []
     for _ in range(size):
-        individual = PuzzleIndividual(letters=letters)
+        individual = PuzzleIndividual(letters=letters, num_addends=num_addends)
         population.append(individual)
     
     return population
@@ -103,17 +135,23 @@ def crossover(parent1, parent2):
     Returns:
         PuzzleIndividual: The child puzzle
     """
-    # Simple implementation: take one word from each parent
-    words1 = parent1.words
-    words2 = parent2.words
-    
-    # Randomly select which words to take from which parent
+    # Randomly select which parent provides the shape of the child
     if random.random() < 0.5:
-        new_puzzle = f"{words1[0]} + {words2[1]} = {words1[2]}"
+        primary, secondary = parent1.words, parent2.words
     else:
-        new_puzzle = f"{words2[0]} + {words1[1]} = {words2[2]}"
+        primary, secondary = parent2.words, parent1.words
     
-    return PuzzleIndividual(puzzle_string=new_puzzle)
+    # Take the result and the even-numbered addends from the primary parent,
+    # and the odd-numbered addends from the secondary parent where it has them
+    primary_addends, secondary_addends = primary[:-1], secondary[:-1]
+    new_words = []
+    for i, word in enumerate(primary_addends):
+        if i % 2 == 1 and i < len(secondary_addends):
+            word = secondary_addends[i]
+        new_words.append(word)
+    new_words.append(primary[-1])
+    
+    return PuzzleIndividual(puzzle_string=format_puzzle(new_words))
 
 
 def mutation(individual, mutation_rate=0.2):
@@ -165,12 +203,13 @@ def mutation(individual, mutation_rate=0.2):
         # Create new puzzle string
         new_words = words.copy()
         new_words[word_idx] = new_word
-        new_puzzle = f"{new_words[0]} + {new_words[1]} = {new_words[2]}"
+        new_puzzle = format_puzzle(new_words)
     
     return PuzzleIndividual(puzzle_string=new_puzzle)
 
 
-def generate_puzzle_ga(letters, population_size=50, generations=20, tournament_size=3, mutation_rate=0.2):
+def generate_puzzle_ga(letters, population_size=50, generations=20, tournament_size=3, mutation_rate=0.2,
+                       target_fitness=None, num_addends=2):
     """
     Generate a cryptarithmetic puzzle using a genetic algorithm.
     
@@ -180,22 +219,42 @@ def generate_puzzle_ga(letters, population_size=50, generations=20, tournament_s
         generations (int): The number of generations to run
         tournament_size (int): The tournament size for selection
         mutation_rate (float): The mutation rate
+        target_fitness (float, optional): Stop early once the best individual reaches this fitness
+        num_addends (int): The number of addends in each puzzle
         
     Returns:
-        PuzzleIndividual: The best puzzle found
+        PuzzleIndividual: The best puzzle found, with the run's feasibility counts
+            in feasibility_checked and feasibility_rejected
     """
+    # Fail before building a population that could never produce a valid puzzle
+    if not 2 <= num_addends <= 8:
+        raise ValueError("A puzzle needs between 2 and 8 addends.")
+    
     # Convert letters to uppercase set
     target_letters = set(letters.upper())
     
+    # Count the puzzles the feasibility pre-filter sees during this run
+    checked = 0
+    rejected = 0
+    
+    def evaluate(individual):
+        nonlocal checked, rejected
+        individual.calculate_fitness(target_letters)
+        checked += 1
+        rejected += individual.rejected
+    
     # Initialize population
-    population = initial_population(population_size, letters)
+    population = initial_population(population_size, letters, num_addends)
     
     # Calculate initial fitness
     for individual in population:
-        individual.calculate_fitness(target_letters)
+        evaluate(individual)
     
     # Main GA loop
     for generation in range(generations):
+        if target_fitness is not None and max(x.fitness for x in population) >= target_fitness:
+            break
+        
         new_population = []
         
         # Elitism: keep the best individual
@@ -215,7 +274,7 @@ def generate_puzzle_ga(letters, population_size=50, generations=20, tournament_s
             child = mutation(child, mutation_rate)
             
             # Calculate fitness
-            child.calculate_fitness(target_letters)
+            evaluate(child)
             
             # Add to new population
             new_population.append(child)
@@ -229,10 +288,13 @@ def generate_puzzle_ga(letters, population_size=50, generations=20, tournament_s
     # If the best individual has a fitness of 0 (no solution), try again with a simple puzzle
     if best_individual.fitness == 0:
         while True:
-            puzzle = generate_simple_puzzle(letters)
+            puzzle = generate_simple_puzzle(letters, num_addends)
             if is_puzzle_solvable(puzzle):
-                individual = PuzzleIndividual(puzzle_string=puzzle)
-                individual.calculate_fitness(target_letters)
-                return individual
+                best_individual = PuzzleIndividual(puzzle_string=puzzle)
+                evaluate(best_individual)
+                break
+    
+    best_individual.feasibility_checked = checked
+    best_individual.feasibility_rejected = rejected
     
     return best_individual
\ No newline at end of file
@@ -0,0 +1,214 @@
+"""
+Keyword-strength audit for the columnar transposition layer.
+
+Given a known plaintext/ciphertext pair and a candidate wordlist, measures how
+quickly a dictionary search recovers the transposition keyword. Candidates that
+produce the same column order are grouped so every distinct permutation is only
+tested once, and the permutations are checked in parallel with early exit.
+"""
+import argparse
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from transposition_cipher import key_sequence_generation_function
+from finishing_touches import load_from_file
+
+
+# Set in every worker process so that a match found by one worker stops the others
+_found_event = None
+
+
+def _init_worker(found_event):
+    global _found_event
+    _found_event = found_event
+
+
+def group_candidates(wordlist, keyword_length=None):
+    """
+    Group candidate keywords by the column order they produce.
+
+    Args:
+        wordlist (iterable): The candidate keywords
+        keyword_length (int, optional): Only keep candidates of this length
+
+    Returns:
+        dict: A mapping of column sequences (tuples) to the candidates producing them
+    """
+    groups = {}
+    for word in wordlist:
+        word = word.strip()
+        if len(word) < 2:
+            continue
+        if keyword_length is not None and len(word) != keyword_length:
+            continue
+        sequence = tuple(key_sequence_generation_function(word))
+        groups.setdefault(sequence, []).append(word)
+    return groups
+
+
+def sequence_matches(plaintext, ciphertext, sequence):
+    """
+    Check whether a column sequence transposes the plaintext into the ciphertext.
+
+    Each column of the transposition is the slice plaintext[col::num_columns], so
+    the ciphertext is compared column by column and rejected at the first mismatch.
+
+    Args:
+        plaintext (str): The known plaintext
+        ciphertext (str): The ciphertext
+        sequence (tuple): The column sequence to test
+
+    Returns:
+        bool: True if the sequence produces the ciphertext, False otherwise
+    """
+    if len(plaintext) != len(ciphertext):
+        return False
+
+    num_columns = len(sequence)
+    offset = 0
+    for col in sequence:
+        column = plaintext[col::num_columns]
+        if not ciphertext.startswith(column, offset):
+            return False
+        offset += len(column)
+    return True
+
+
+def _test_sequences(plaintext, ciphertext, sequences):
+    # Worker: test a batch of sequences, stopping as soon as any worker finds a match.
+    # Only the testing itself is timed, not process startup or scheduling.
+    start = time.perf_counter()
+    matches = []
+    tested = 0
+    for sequence in sequences:
+        if _found_event is not None and _found_event.is_set():
+            break
+        tested += 1
+        if sequence_matches(plaintext, ciphertext, sequence):
+            matches.append(sequence)
+            if _found_event is not None:
+                _found_event.set()
+            break
+    return matches, tested, time.perf_counter() - start
+
+
+def audit_keywords(plaintext, ciphertext, wordlist, keyword_length=None, workers=None, batch_size=1000):
+    """
+    Search a wordlist for the keyword that transposes the plaintext into the ciphertext.
+
+    Args:
+        plaintext (str): The known plaintext
+        ciphertext (str): The ciphertext produced by encryption_function
+        wordlist (iterable): The candidate keywords
+        keyword_length (int, optional): Only test candidates of this length
+        workers (int, optional): The number of worker processes, os.cpu_count() if None
+        batch_size (int): The number of permutations sent to a worker at a time
+
+    Returns:
+        dict: An audit report with the recovered keywords and the search cost
+    """
+    start = time.perf_counter()
+    groups = group_candidates(wordlist, keyword_length)
+    sequences = list(groups)
+    candidates = sum(len(words) for words in groups.values())
+
+    batches = [sequences[i:i + batch_size] for i in range(0, len(sequences), batch_size)]
+    matches = []
+    tested = 0
+    work_time = 0.0
+
+    if batches:
+        # A plain Event shared with the workers when they start; checking it is a local
+        # semaphore read, unlike a Manager proxy which costs a round trip per call
+        found_event = multiprocessing.Event()
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                                 initializer=_init_worker, initargs=(found_event,)) as executor:
+            futures = [executor.submit(_test_sequences, plaintext, ciphertext, batch) for batch in batches]
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                batch_matches, batch_tested, batch_time = future.result()
+                tested += batch_tested
+                work_time += batch_time
+                if batch_matches:
+                    matches.extend(batch_matches)
+                    # Early exit: drop the batches that have not started yet
+                    for pending in futures:
+                        pending.cancel()
+
+    elapsed = time.perf_counter() - start
+    keywords = list(dict.fromkeys(word for sequence in matches for word in groups[sequence]))
+
+    return {
+        "found": bool(matches),
+        "keywords": keywords,
+        "candidates": candidates,
+        "distinct_permutations": len(sequences),
+        "permutations_tested": tested,
+        "elapsed": elapsed,
+        "time_per_permutation": work_time / tested if tested else None,
+    }
+
+
+def search_cost(keyword_length, time_per_permutation=None):
+    """
+    Estimate the cost of an exhaustive search for a keyword of the given length.
+
+    Every column order of the given length can be produced by some keyword, so an
+    exhaustive search has to test keyword_length! permutations.
+
+    Args:
+        keyword_length (int): The keyword length
+        time_per_permutation (float, optional): The measured time to test one permutation
+
+    Returns:
+        dict: The number of permutations and the estimated time in seconds (None if no timing was given)
+    """
+    permutations = math.factorial(keyword_length)
+    return {
+        "keyword_length": keyword_length,
+        "permutations": permutations,
+        "estimated_time": permutations * time_per_permutation if time_per_permutation else None,
+    }
+
+
+def main():
+    """
+    Run a keyword audit from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Audit transposition keyword strength against a wordlist.")
+    parser.add_argument("plaintext_file")
+    parser.add_argument("ciphertext_file")
+    parser.add_argument("wordlist_file")
+    parser.add_argument("--length", type=int, default=None, help="Only test keywords of this length")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    plaintext = load_from_file(args.plaintext_file)
+    ciphertext = load_from_file(args.ciphertext_file)
+    wordlist = load_from_file(args.wordlist_file)
+    if plaintext is None or ciphertext is None or wordlist is None:
+        return
+
+    report = audit_keywords(plaintext, ciphertext, wordlist.split(), args.length, args.workers)
+    print(f"Candidates: {report['candidates']} ({report['distinct_permutations']} distinct permutations)")
+    print(f"Permutations tested: {report['permutations_tested']} in {report['elapsed']:.3f}s")
+    if report["found"]:
+        print(f"Keyword recovered: {', '.join(report['keywords'])}")
+    else:
+        print("Keyword not found in the wordlist.")
+
+    if args.length is not None:
+        cost = search_cost(args.length, report["time_per_permutation"])
+        print(f"Exhaustive search for length {args.length}: {cost['permutations']} permutations", end="")
+        if cost["estimated_time"] is not None:
+            print(f", about {cost['estimated_time']:.1f}s")
+        else:
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark of the cost of checking a complete assignment (a leaf of the solver).
+
+Compares the generic evaluate_puzzle, the coefficient form used by the solver
+and the compiled per-puzzle checker, then times full solves with and without
+the compiled checker.
+"""
+import random
+import time
+import timeit
+
+from cryptarithmetic import (parse_puzzle, evaluate_puzzle, letter_coefficients, evaluate_coefficients,
+                             compile_puzzle_checker, solve_cryptarithmetic)
+
+
+PUZZLES = [
+    "SEND + MORE = MONEY",
+    "TO + GO = OUT",
+    "ONE + TWO + FOUR = SEVEN",
+    "AB + CD + EF + GH = IJA",
+]
+
+
+def random_assignments(letters, count, seed=0):
+    """
+    Generate random complete assignments of distinct digits.
+
+    Args:
+        letters (list): The letters to assign
+        count (int): The number of assignments
+        seed (int): The random seed
+
+    Returns:
+        list: A list of letter-to-digit dictionaries
+    """
+    rng = random.Random(seed)
+    return [dict(zip(letters, rng.sample(range(10), len(letters)))) for _ in range(count)]
+
+
+def benchmark_leaf_checks(puzzle_string, count=20000, repeat=5):
+    """
+    Time one leaf check with each checker.
+
+    Args:
+        puzzle_string (str): The puzzle string
+        count (int): The number of assignments checked per run
+        repeat (int): The number of runs (the fastest is kept)
+
+    Returns:
+        dict: The time per check in nanoseconds for each checker
+    """
+    words, letters = parse_puzzle(puzzle_string)
+    assignments = random_assignments(sorted(letters), count)
+    coefficients = letter_coefficients(words)
+    checker, checker_letters = compile_puzzle_checker(words)
+
+    checks = {
+        "evaluate_puzzle": lambda: [evaluate_puzzle(words, a) for a in assignments],
+        "coefficients": lambda: [evaluate_coefficients(coefficients, a) for a in assignments],
+        "compiled": lambda: [checker(*map(a.__getitem__, checker_letters)) for a in assignments],
+    }
+
+    return {name: min(timeit.repeat(check, number=1, repeat=repeat)) / count * 1e9
+            for name, check in checks.items()}
+
+
+def benchmark_solve(puzzle_string):
+    """
+    Time a full solve with the generic and the compiled leaf check.
+
+    Args:
+        puzzle_string (str): The puzzle string
+
+    Returns:
+        dict: The solve time in seconds for each option
+    """
+    times = {}
+    for name, compiled in (("generic", False), ("compiled", True)):
+        start = time.perf_counter()
+        solve_cryptarithmetic(puzzle_string, compiled=compiled)
+        times[name] = time.perf_counter() - start
+    return times
+
+
+def main():
+    """
+    Run the benchmark and print the results.
+    """
+    print("Leaf check cost (ns per assignment)")
+    for puzzle in PUZZLES:
+        results = benchmark_leaf_checks(puzzle)
+        print(f"  {puzzle}: " + ", ".join(f"{name} {value:.0f}" for name, value in results.items()))
+
+    print("Full solve (s)")
+    for puzzle in PUZZLES[:2]:
+        results = benchmark_solve(puzzle)
+        print(f"  {puzzle}: " + ", ".join(f"{name} {value:.2f}" for name, value in results.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,167 @@ import threading
 import time
 
 from encryption import encrypt, decrypt
-from finishing_touches import save_to_file, load_from_file, is_valid_keyword, format_puzzle_display
+from finishing_touches import save_to_file, save_chunks_to_file, load_from_file, is_valid_keyword, format_puzzle_display
+
+
+# Results and loaded files larger than this are kept out of the Text widgets
+LARGE_TEXT_THRESHOLD = 100000
+
+
+class PagedTextView(ttk.Frame):
+    """
+    Read-only text view that renders only the visible window of a large buffer.
+
+    The full content is kept in a Python string and split into display rows once;
+    scrolling re-renders the rows around the new position instead of handing the
+    whole buffer to Tk.
+    """
+    def __init__(self, parent, height=10, width=50, max_row_length=1000, overscan=20):
+        """
+        Initialize the paged view.
+        
+        Args:
+            parent: The parent widget
+            height (int): The number of visible rows
+            width (int): The width of the view in characters
+            max_row_length (int): Lines longer than this are split into several rows
+            overscan (int): Extra rows rendered past the visible window
+        """
+        super().__init__(parent)
+        self.visible_rows = height
+        self.max_row_length = max_row_length
+        self.overscan = overscan
+        
+        self.buffer = ""
+        self.row_offsets = [0]
+        self.first_row = 0
+        
+        self.text = tk.Text(self, height=height, width=width, wrap="none", state="disabled")
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.on_scrollbar)
+        self.text.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+        
+        # Take over wheel scrolling so the Text widget never scrolls on its own
+        self.text.bind("<MouseWheel>", self.on_mousewheel)
+        self.text.bind("<Button-4>", lambda event: self.scroll_rows(-3))
+        self.text.bind("<Button-5>", lambda event: self.scroll_rows(3))
+        self.text.bind("<Prior>", lambda event: self.scroll_rows(-self.visible_rows))
+        self.text.bind("<Next>", lambda event: self.scroll_rows(self.visible_rows))
+    
+    def set_content(self, content):
+        """
+        Replace the buffer and render its first page.
+        
+        Args:
+            content (str): The content to display
+        """
+        self.buffer = content
+        self.row_offsets = self.compute_row_offsets(content)
+        self.first_row = 0
+        self.render()
+    
+    def get_content(self):
+        """
+        Return the full buffer (not just the rendered window).
+        
+        Returns:
+            str: The content of the view
+        """
+        return self.buffer
+    
+    def clear(self):
+        """
+        Remove all content from the view.
+        """
+        self.set_content("")
+    
+    def iter_chunks(self, chunk_size=65536):
+        """
+        Iterate over the buffer in fixed-size chunks.
+        
+        Args:
+            chunk_size (int): The number of characters per chunk
+            
+        Yields:
+            str: Consecutive slices of the buffer
+        """
+        for start in range(0, len(self.buffer), chunk_size):
+            yield self.buffer[start:start + chunk_size]
+    
+    def compute_row_offsets(self, content):
+        """
+        Compute the start offset of every display row in the content.
+        
+        Args:
+            content (str): The content to split
+            
+        Returns:
+            list: Row start offsets, followed by the length of the content
+        """
+        offsets = []
+        start = 0
+        length = len(content)
+        while start < length:
+            newline = content.find("\n", start)
+            line_end = length if newline == -1 else newline + 1
+            # Split very long lines so a single row never gets too large to render
+            for row_start in range(start, line_end, self.max_row_length):
+                offsets.append(row_start)
+            start = line_end
+        offsets.append(length)
+        return offsets
+    
+    def total_rows(self):
+        return len(self.row_offsets) - 1
+    
+    def render(self):
+        """
+        Render the rows of the buffer around the current scroll position.
+        """
+        total = self.total_rows()
+        last_row = min(total, self.first_row + self.visible_rows + self.overscan)
+        window = self.buffer[self.row_offsets[self.first_row]:self.row_offsets[last_row]]
+        
+        self.text.config(state="normal")
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", window)
+        self.text.config(state="disabled")
+        
+        if total == 0:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            visible_end = min(total, self.first_row + self.visible_rows)
+            self.scrollbar.set(self.first_row / total, visible_end / total)
+    
+    def scroll_to(self, row):
+        """
+        Scroll so that the given row is the first visible row.
+        
+        Args:
+            row (int): The row to scroll to
+        """
+        max_first_row = max(0, self.total_rows() - self.visible_rows)
+        row = max(0, min(int(row), max_first_row))
+        if row != self.first_row:
+            self.first_row = row
+            self.render()
+    
+    def scroll_rows(self, count):
+        self.scroll_to(self.first_row + count)
+        return "break"
+    
+    def on_mousewheel(self, event):
+        return self.scroll_rows(-3 if event.delta > 0 else 3)
+    
+    def on_scrollbar(self, action, amount, unit=None):
+        # The scrollbar reports either an absolute position or a relative step
+        if action == "moveto":
+            self.scroll_to(float(amount) * self.total_rows())
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.scroll_rows(int(amount) * step)
 
 
 class HybridEncryptionApp:
@@ -46,6 +206,9 @@ class HybridEncryptionApp:
         self.plaintext_input = tk.Text(input_frame, height=10, width=50)
         self.plaintext_input.grid(row=1, column=0, padx=5, pady=5, sticky="nsew")
         
+        # Large files loaded from disk are kept here instead of in the input box
+        self.loaded_plaintext = None
+        
         # Keyword input
         ttk.Label(input_frame, text="Keyword:").grid(row=2, column=0, sticky="w", padx=5, pady=5)
         self.encrypt_keyword_input = ttk.Entry(input_frame, width=20)
@@ -61,13 +224,16 @@ class HybridEncryptionApp:
         self.load_plaintext_button = ttk.Button(button_frame, text="Load from File", command=self.load_plaintext)
         self.load_plaintext_button.pack(side=tk.LEFT, padx=5)
         
+        self.clear_plaintext_button = ttk.Button(button_frame, text="Clear", command=self.clear_plaintext)
+        self.clear_plaintext_button.pack(side=tk.LEFT, padx=5)
+        
         # Frame for output
         output_frame = ttk.LabelFrame(self.encrypt_tab, text="Output")
         output_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Encrypted output
         ttk.Label(output_frame, text="Encrypted Puzzle:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        self.encrypted_output = tk.Text(output_frame, height=10, width=50, state="disabled")
+        self.encrypted_output = PagedTextView(output_frame, height=10, width=50)
         self.encrypted_output.grid(row=1, column=0, padx=5, pady=5, sticky="nsew")
         
         # Buttons for output
@@ -83,4 +249,228 @@ class HybridEncryptionApp:
         
         # Status label
         self.encrypt_status = ttk.Label(self.encrypt_tab, text="Ready")
-        self.encrypt_status.pack(padx=10, pady=5, anchor="w")
\ No newline at end of file
+        self.encrypt_status.pack(padx=10, pady=5, anchor="w")
+    
+    def setup_decrypt_tab(self):
+        # Frame for input
+        input_frame = ttk.LabelFrame(self.decrypt_tab, text="Input")
+        input_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        # Puzzle input
+        ttk.Label(input_frame, text="Encrypted Puzzle:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        self.ciphertext_input = tk.Text(input_frame, height=10, width=50)
+        self.ciphertext_input.grid(row=1, column=0, padx=5, pady=5, sticky="nsew")
+        
+        # Keyword input
+        ttk.Label(input_frame, text="Keyword:").grid(row=2, column=0, sticky="w", padx=5, pady=5)
+        self.decrypt_keyword_input = ttk.Entry(input_frame, width=20)
+        self.decrypt_keyword_input.grid(row=3, column=0, padx=5, pady=5, sticky="w")
+        
+        # Buttons
+        button_frame = ttk.Frame(input_frame)
+        button_frame.grid(row=4, column=0, padx=5, pady=10, sticky="w")
+        
+        self.decrypt_button = ttk.Button(button_frame, text="Decrypt", command=self.perform_decryption)
+        self.decrypt_button.pack(side=tk.LEFT, padx=5)
+        
+        self.load_ciphertext_button = ttk.Button(button_frame, text="Load from File", command=self.load_ciphertext)
+        self.load_ciphertext_button.pack(side=tk.LEFT, padx=5)
+        
+        # Frame for output
+        output_frame = ttk.LabelFrame(self.decrypt_tab, text="Output")
+        output_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        # Decrypted output
+        ttk.Label(output_frame, text="Decrypted Text:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        self.decrypted_output = PagedTextView(output_frame, height=10, width=50)
+        self.decrypted_output.grid(row=1, column=0, padx=5, pady=5, sticky="nsew")
+        
+        # Buttons for output
+        output_button_frame = ttk.Frame(output_frame)
+        output_button_frame.grid(row=2, column=0, padx=5, pady=10, sticky="w")
+        
+        self.save_decrypted_button = ttk.Button(output_button_frame, text="Save to File", command=self.save_decrypted)
+        self.save_decrypted_button.pack(side=tk.LEFT, padx=5)
+        
+        # Progress indicator
+        self.decrypt_progress = ttk.Progressbar(self.decrypt_tab, orient="horizontal", length=200, mode="indeterminate")
+        self.decrypt_progress.pack(padx=10, pady=10, fill="x")
+        
+        # Status label
+        self.decrypt_status = ttk.Label(self.decrypt_tab, text="Ready")
+        self.decrypt_status.pack(padx=10, pady=5, anchor="w")
+    
+    def get_plaintext(self):
+        """
+        Return the plaintext to encrypt, preferring a large file loaded from disk.
+        
+        Returns:
+            str: The plaintext
+        """
+        if self.loaded_plaintext is not None:
+            return self.loaded_plaintext
+        return self.plaintext_input.get("1.0", tk.END).strip()
+    
+    def load_plaintext(self):
+        filename = filedialog.askopenfilename(filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+        if not filename:
+            return
+        
+        content = load_from_file(filename)
+        if content is None:
+            messagebox.showerror("Error", "Failed to load the file.")
+            return
+        
+        self.plaintext_input.config(state="normal")
+        self.plaintext_input.delete("1.0", tk.END)
+        
+        if len(content) > LARGE_TEXT_THRESHOLD:
+            # Only show a preview; inserting megabytes into a Text widget stalls the main loop
+            self.loaded_plaintext = content
+            self.plaintext_input.insert("1.0", content[:LARGE_TEXT_THRESHOLD // 10])
+            self.plaintext_input.config(state="disabled")
+            self.encrypt_status.config(text=f"Loaded {len(content)} characters (preview shown)")
+        else:
+            self.loaded_plaintext = None
+            self.plaintext_input.insert("1.0", content)
+            self.encrypt_status.config(text="Ready")
+    
+    def clear_plaintext(self):
+        # Discard a loaded file and give the input box back to the user
+        self.loaded_plaintext = None
+        self.plaintext_input.config(state="normal")
+        self.plaintext_input.delete("1.0", tk.END)
+        self.encrypt_status.config(text="Ready")
+    
+    def perform_encryption(self):
+        plaintext = self.get_plaintext()
+        keyword = self.encrypt_keyword_input.get().strip()
+        
+        if not plaintext:
+            messagebox.showerror("Error", "Please enter some plaintext to encrypt.")
+            return
+        if not is_valid_keyword(keyword):
+            messagebox.showerror("Error", "The keyword must be at least 2 letters long and contain only letters.")
+            return
+        
+        self.encrypt_button.config(state="disabled")
+        self.encrypt_progress.start()
+        self.encrypt_status.config(text="Encrypting...")
+        
+        # Run the genetic algorithm off the main loop so the window stays responsive
+        def worker():
+            start = time.time()
+            try:
+                puzzle_string, _ = encrypt(plaintext, keyword)
+            except Exception as e:
+                self.root.after(0, self.finish_encryption, None, str(e), 0)
+                return
+            self.root.after(0, self.finish_encryption, puzzle_string, None, time.time() - start)
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def finish_encryption(self, puzzle_string, error, elapsed):
+        self.encrypt_progress.stop()
+        self.encrypt_button.config(state="normal")
+        
+        if error is not None:
+            self.encrypt_status.config(text="Encryption failed")
+            messagebox.showerror("Error", f"Encryption failed: {error}")
+            return
+        
+        self.show_encrypted(puzzle_string)
+        self.encrypt_status.config(text=f"Encrypted in {elapsed:.2f} seconds")
+    
+    def show_encrypted(self, puzzle_string):
+        self.encrypted_output.set_content(format_puzzle_display(puzzle_string))
+    
+    def save_encrypted(self):
+        if not self.encrypted_output.get_content():
+            messagebox.showerror("Error", "There is no encrypted output to save.")
+            return
+        
+        filename = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+        if not filename:
+            return
+        
+        # Stream from the view's buffer rather than reading back through the widget
+        if save_chunks_to_file(self.encrypted_output.iter_chunks(), filename):
+            messagebox.showinfo("Success", "Encrypted puzzle saved successfully.")
+        else:
+            messagebox.showerror("Error", "Failed to save the file.")
+    
+    def load_ciphertext(self):
+        filename = filedialog.askopenfilename(filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+        if not filename:
+            return
+        
+        content = load_from_file(filename)
+        if content is None:
+            messagebox.showerror("Error", "Failed to load the file.")
+            return
+        
+        self.ciphertext_input.delete("1.0", tk.END)
+        self.ciphertext_input.insert("1.0", content)
+    
+    def perform_decryption(self):
+        puzzle_string = self.ciphertext_input.get("1.0", tk.END).strip()
+        keyword = self.decrypt_keyword_input.get().strip()
+        
+        if not puzzle_string:
+            messagebox.showerror("Error", "Please enter an encrypted puzzle to decrypt.")
+            return
+        if not is_valid_keyword(keyword):
+            messagebox.showerror("Error", "The keyword must be at least 2 letters long and contain only letters.")
+            return
+        
+        self.decrypt_button.config(state="disabled")
+        self.decrypt_progress.start()
+        self.decrypt_status.config(text="Decrypting...")
+        
+        # Solving the puzzles can take a while, so keep it off the main loop as well
+        def worker():
+            start = time.time()
+            try:
+                plaintext = decrypt(puzzle_string, keyword)
+            except Exception as e:
+                self.root.after(0, self.finish_decryption, None, str(e), 0)
+                return
+            self.root.after(0, self.finish_decryption, plaintext, None, time.time() - start)
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def finish_decryption(self, plaintext, error, elapsed):
+        self.decrypt_progress.stop()
+        self.decrypt_button.config(state="normal")
+        
+        if error is not None:
+            self.decrypt_status.config(text="Decryption failed")
+            messagebox.showerror("Error", f"Decryption failed: {error}")
+            return
+        
+        self.decrypted_output.set_content(plaintext)
+        self.decrypt_status.config(text=f"Decrypted in {elapsed:.2f} seconds")
+    
+    def save_decrypted(self):
+        if not self.decrypted_output.get_content():
+            messagebox.showerror("Error", "There is no decrypted output to save.")
+            return
+        
+        filename = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+        if not filename:
+            return
+        
+        if save_chunks_to_file(self.decrypted_output.iter_chunks(), filename):
+            messagebox.showinfo("Success", "Decrypted text saved successfully.")
+        else:
+            messagebox.showerror("Error", "Failed to save the file.")
+
+
+def main():
+    root = tk.Tk()
+    HybridEncryptionApp(root)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
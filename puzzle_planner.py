@@ -0,0 +1,182 @@
+"""
+Planning of the puzzle sequence for a message.
+
+A cryptarithmetic puzzle can hold at most 10 distinct letters, so the letter set
+of a long message is split into the fewest groups of at most 10 letters, with one
+puzzle per group. Puzzles are generated in parallel and kept in a puzzle bank so
+that groups repeating across messages reuse an existing puzzle.
+"""
+import json
+import os
+import random
+import string
+from concurrent.futures import ProcessPoolExecutor
+
+from cryptarithmetic import parse_puzzle
+from genetic_algorithm import generate_puzzle_ga
+from ga_tuning import select_ga_parameters, addends_for_group
+
+
+MAX_PUZZLE_LETTERS = 10
+
+# The letters of the single puzzle generated for a text without any letters
+DEFAULT_PUZZLE_LETTERS = string.ascii_uppercase[:MAX_PUZZLE_LETTERS]
+
+DEFAULT_BANK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "puzzle_bank.json")
+
+# Loaded puzzle banks, keyed by filename
+_bank_cache = {}
+
+
+def group_key(letters):
+    return ''.join(sorted(set(letters)))
+
+
+def load_puzzle_bank(filename=DEFAULT_BANK_PATH):
+    """
+    Load a puzzle bank from a JSON file.
+
+    Args:
+        filename (str): The filename to load from
+
+    Returns:
+        dict: A mapping of puzzle letter sets to puzzle strings (empty if the file does not exist)
+    """
+    if filename in _bank_cache:
+        return _bank_cache[filename]
+
+    bank = {}
+    if os.path.exists(filename):
+        try:
+            with open(filename, 'r') as file:
+                bank = json.load(file)
+        except Exception as e:
+            print(f"Error loading puzzle bank: {e}")
+
+    _bank_cache[filename] = bank
+    return bank
+
+
+def save_puzzle_bank(bank, filename=DEFAULT_BANK_PATH):
+    """
+    Save a puzzle bank to a JSON file.
+
+    Args:
+        bank (dict): A mapping of puzzle letter sets to puzzle strings
+        filename (str): The filename to save to
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        with open(filename, 'w') as file:
+            json.dump(bank, file, indent=2, sort_keys=True)
+        _bank_cache[filename] = bank
+        return True
+    except Exception as e:
+        print(f"Error saving puzzle bank: {e}")
+        return False
+
+
+def _num_groups(count):
+    # Fewest groups of at most MAX_PUZZLE_LETTERS letters
+    return -(-count // MAX_PUZZLE_LETTERS)
+
+
+def plan_letter_groups(text, bank=None):
+    """
+    Partition the letters (A-Z, case-insensitive) of a text into the fewest puzzle-sized groups.
+
+    Banked puzzles are used first (greedy set cover over the letters each puzzle
+    actually contains) whenever one covers enough of the remaining letters not
+    to increase the number of puzzles. The rest of the letters are split into
+    evenly sized groups of at most 10 letters.
+
+    Args:
+        text (str): The text whose letters the puzzles should cover
+        bank (dict, optional): A mapping of puzzle letter sets to puzzle strings
+
+    Returns:
+        list: A list of (letters, puzzle) pairs where puzzle is a banked puzzle
+            string, or None if a puzzle still has to be generated for the letters
+    """
+    if bank is None:
+        bank = {}
+    remaining = set(text.upper()) & set(string.ascii_uppercase)
+    plan = []
+
+    # Greedy set cover with the letters of the banked puzzles
+    banked_letters = {puzzle: parse_puzzle(puzzle)[1] for puzzle in set(bank.values())}
+    while remaining and banked_letters:
+        puzzle = max(banked_letters, key=lambda p: (len(banked_letters[p] & remaining), p))
+        covered = banked_letters.pop(puzzle) & remaining
+        if not covered or 1 + _num_groups(len(remaining - covered)) > _num_groups(len(remaining)):
+            break
+        plan.append((group_key(covered), puzzle))
+        remaining -= covered
+
+    # Split the remaining letters into evenly sized groups
+    letters = sorted(remaining)
+    num_groups = _num_groups(len(letters))
+    for i in range(num_groups):
+        group = ''.join(letters[i::num_groups])
+        puzzle = bank.get(group)
+        if puzzle is not None and not set(group) <= parse_puzzle(puzzle)[1]:
+            puzzle = None
+        plan.append((group, puzzle))
+
+    return plan
+
+
+def _generate_group_puzzle(letters, ga_parameters):
+    # Runs in a worker process, so the feasibility counts are sent back with the puzzle
+    best = generate_puzzle_ga(letters, **ga_parameters)
+    return best.puzzle_string, best.feasibility_checked, best.feasibility_rejected
+
+
+def generate_planned_puzzles(text, profile=None, bank_file=None, workers=None):
+    """
+    Generate the puzzle sequence for a text.
+
+    Args:
+        text (str): The text whose letters the puzzles should cover
+        profile (dict, optional): A tuned GA profile (see ga_tuning)
+        bank_file (str, optional): The puzzle bank file (e.g. DEFAULT_BANK_PATH), or None to disable the bank
+        workers (int, optional): The number of worker processes, os.cpu_count() if None (1 runs in-process)
+
+    Returns:
+        tuple: (puzzles, feasibility) where puzzles lists the puzzle strings in plan
+            order and feasibility holds the "checked" and "rejected" counts of the
+            feasibility pre-filter over all generated puzzles
+    """
+    bank = load_puzzle_bank(bank_file) if bank_file else {}
+    plan = plan_letter_groups(text, bank)
+
+    # A text without letters still gets one puzzle, built from the default letters
+    if not plan:
+        plan = [(DEFAULT_PUZZLE_LETTERS, None)]
+
+    missing = [letters for letters, puzzle in plan if puzzle is None]
+    arguments = [(letters, dict(select_ga_parameters(letters, profile), num_addends=addends_for_group(letters)))
+                 for letters in missing]
+
+    if len(arguments) > 1 and workers != 1:
+        # Worker processes may start with a copy of the parent's random state, so reseed them
+        with ProcessPoolExecutor(max_workers=workers, initializer=random.seed) as executor:
+            generated = list(executor.map(_generate_group_puzzle, *zip(*arguments)))
+    else:
+        generated = [_generate_group_puzzle(letters, ga_parameters) for letters, ga_parameters in arguments]
+
+    new_puzzles = {letters: puzzle for letters, (puzzle, _, _) in zip(missing, generated)}
+    feasibility = {
+        "checked": sum(checked for _, checked, _ in generated),
+        "rejected": sum(rejected for _, _, rejected in generated),
+    }
+    puzzles = [puzzle if puzzle is not None else new_puzzles[letters] for letters, puzzle in plan]
+
+    if bank_file and new_puzzles:
+        # Key each puzzle by the letters it really contains, which may differ from its group
+        bank.update({group_key(parse_puzzle(puzzle)[1]): puzzle for puzzle in new_puzzles.values()})
+        save_puzzle_bank(bank, bank_file)
+
+    return puzzles, feasibility
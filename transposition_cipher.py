@@ -3,6 +3,9 @@
 # the  string to be encrypted is written under the keyword, transposed to be exact
 # then read in order of keywords as columns
 
+from functools import lru_cache
+
+
 def key_sequence_generation_function(keyword):
     # takes in keywords and return list of numbers for column order
 
@@ -132,6 +135,82 @@ def decryption_function(ciphertext, keyword):
         decrypted_text += ''.join(row)
 
     return decrypted_text
+
+
+# multi-round transposition: instead of running the matrix transposition once per keyword,
+# every round is turned into an index permutation, the rounds are composed into one permutation
+# and the text is gathered through it in a single pass
+
+def transposition_permutation(keyword, length):
+    # takes in a keyword and message length and returns the permutation of one encryption round,
+    # as a list where position i of the ciphertext holds plaintext[permutation[i]]
+
+    # 1. we generate the column order like the encryption function
+    column_sequence = key_sequence_generation_function(keyword)
+    num_columns = len(keyword)
+
+    # 2. column col of the matrix holds the plaintext indices col, col + num_columns, ...
+    permutation = []
+    for col in column_sequence:
+        permutation.extend(range(col, length, num_columns))
+    return permutation
+
+
+# a cached permutation is a tuple of `length` ints, roughly 36 bytes per message character
+# (an 8-byte slot plus the int object), so a 10 MB message pins about 360 MB per entry;
+# only a few (keywords, length) pairs are kept, enough for repeated calls on the same message
+PERMUTATION_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=PERMUTATION_CACHE_SIZE)
+def composed_permutation(keywords, length):
+    # takes in a tuple of keywords (in round order) and a message length and returns one
+    # permutation (as a tuple) equivalent to applying every round in turn
+
+    composed = list(range(length))
+    for keyword in keywords:
+        # after this round, position i holds what was at position round_permutation[i] before it
+        round_permutation = transposition_permutation(keyword, length)
+        composed = [composed[index] for index in round_permutation]
+    return tuple(composed)
+
+
+@lru_cache(maxsize=PERMUTATION_CACHE_SIZE)
+def inverse_composed_permutation(keywords, length):
+    # takes in a tuple of keywords and a message length and returns the inverse of the composed permutation
+    permutation = composed_permutation(keywords, length)
+    inverse = [0] * length
+    for position, index in enumerate(permutation):
+        inverse[index] = position
+    return tuple(inverse)
+
+
+def multi_round_encryption_function(plaintext, keywords):
+    # takes in a string and a list of keywords and returns the text encrypted once per keyword, in order
+    permutation = composed_permutation(tuple(keywords), len(plaintext))
+    return ''.join([plaintext[index] for index in permutation])
+
+
+def multi_round_decryption_function(ciphertext, keywords):
+    # takes in a string and the list of keywords used for encryption and returns the decrypted text
+    inverse = inverse_composed_permutation(tuple(keywords), len(ciphertext))
+    return ''.join([ciphertext[position] for position in inverse])
+
+
+# single-round wrappers used by the hybrid encryption; they go through the permutation
+# functions above because decryption_function does not invert encryption_function when
+# the text length is not a multiple of the keyword length
+
+def encrypt_transposition(plaintext, keyword):
+    # takes in a string and keyword and returns the encrypted text
+    return multi_round_encryption_function(plaintext, [keyword])
+
+
+def decrypt_transposition(ciphertext, keyword):
+    # takes in a string and keyword and returns the decrypted text
+    return multi_round_decryption_function(ciphertext, [keyword])
+
+
 def main():
     """
     Main function to run the columnar transposition cipher example.